@@ -1,6 +1,7 @@
 """Demo platform for the Device tracker component."""
 from __future__ import annotations
 
+import asyncio
 import random
 
 from homeassistant.core import ServiceCall
@@ -8,16 +9,17 @@ from homeassistant.core import ServiceCall
 from .const import DOMAIN, SERVICE_RANDOMIZE_DEVICE_TRACKER_DATA
 
 
-def setup_scanner(hass, config, see, discovery_info=None):
+async def async_setup_scanner(hass, config, async_see, discovery_info=None):
     """Set up the demo tracker."""
 
     def offset():
         """Return random offset."""
-        return (random.randrange(500, 2000)) / 2e5 * random.choice((-1, 1))
+        magnitude = random.uniform(0.0025, 0.01)
+        return magnitude if random.random() < 0.5 else -magnitude
 
-    def random_see(dev_id, name):
+    async def async_random_see(dev_id, name):
         """Randomize a sighting."""
-        see(
+        await async_see(
             dev_id=dev_id,
             host_name=name,
             gps=(hass.config.latitude + offset(), hass.config.longitude + offset()),
@@ -25,14 +27,16 @@ def setup_scanner(hass, config, see, discovery_info=None):
             battery=random.randrange(10, 90),
         )
 
-    def observe(call: ServiceCall | None = None) -> None:
+    async def observe(call: ServiceCall | None = None) -> None:
         """Observe three entities."""
-        random_see("demo_paulus", "Paulus")
-        random_see("demo_anne_therese", "Anne Therese")
+        await asyncio.gather(
+            async_random_see("demo_paulus", "Paulus"),
+            async_random_see("demo_anne_therese", "Anne Therese"),
+        )
 
-    observe()
+    await observe()
 
-    see(
+    await async_see(
         dev_id="demo_home_boy",
         host_name="Home Boy",
         gps=[hass.config.latitude - 0.00002, hass.config.longitude + 0.00002],
@@ -40,6 +44,6 @@ def setup_scanner(hass, config, see, discovery_info=None):
         battery=53,
     )
 
-    hass.services.register(DOMAIN, SERVICE_RANDOMIZE_DEVICE_TRACKER_DATA, observe)
+    hass.services.async_register(DOMAIN, SERVICE_RANDOMIZE_DEVICE_TRACKER_DATA, observe)
 
     return True
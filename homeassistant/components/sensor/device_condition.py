@@ -1,18 +1,28 @@
 """Provides device conditions for sensors."""
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
+
 import voluptuous as vol
 
 from homeassistant.components.device_automation.exceptions import (
     InvalidDeviceAutomationConfig,
 )
-from homeassistant.const import CONF_ABOVE, CONF_BELOW, CONF_ENTITY_ID, CONF_TYPE
+from homeassistant.const import (
+    ATTR_DEVICE_CLASS,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONF_ABOVE,
+    CONF_BELOW,
+    CONF_ENTITY_ID,
+    CONF_TYPE,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import condition, config_validation as cv
-from homeassistant.helpers.entity import get_device_class, get_unit_of_measurement
+from homeassistant.helpers.entity import get_unit_of_measurement
 from homeassistant.helpers.entity_registry import (
-    async_entries_for_device,
+    async_entries_for_device_and_domain,
     async_get_registry,
 )
 from homeassistant.helpers.typing import ConfigType
@@ -51,75 +61,58 @@ CONF_IS_VOLATILE_ORGANIC_COMPOUNDS = "is_volatile_organic_compounds"
 CONF_IS_VOLTAGE = "is_voltage"
 CONF_IS_VALUE = "is_value"
 
-ENTITY_CONDITIONS = {
-    SensorDeviceClass.APPARENT_POWER: [{CONF_TYPE: CONF_IS_APPARENT_POWER}],
-    SensorDeviceClass.BATTERY: [{CONF_TYPE: CONF_IS_BATTERY_LEVEL}],
-    SensorDeviceClass.CO: [{CONF_TYPE: CONF_IS_CO}],
-    SensorDeviceClass.CO2: [{CONF_TYPE: CONF_IS_CO2}],
-    SensorDeviceClass.CURRENT: [{CONF_TYPE: CONF_IS_CURRENT}],
-    SensorDeviceClass.ENERGY: [{CONF_TYPE: CONF_IS_ENERGY}],
-    SensorDeviceClass.FREQUENCY: [{CONF_TYPE: CONF_IS_FREQUENCY}],
-    SensorDeviceClass.GAS: [{CONF_TYPE: CONF_IS_GAS}],
-    SensorDeviceClass.HUMIDITY: [{CONF_TYPE: CONF_IS_HUMIDITY}],
-    SensorDeviceClass.ILLUMINANCE: [{CONF_TYPE: CONF_IS_ILLUMINANCE}],
-    SensorDeviceClass.NITROGEN_DIOXIDE: [{CONF_TYPE: CONF_IS_NITROGEN_DIOXIDE}],
-    SensorDeviceClass.NITROGEN_MONOXIDE: [{CONF_TYPE: CONF_IS_NITROGEN_MONOXIDE}],
-    SensorDeviceClass.NITROUS_OXIDE: [{CONF_TYPE: CONF_IS_NITROUS_OXIDE}],
-    SensorDeviceClass.OZONE: [{CONF_TYPE: CONF_IS_OZONE}],
-    SensorDeviceClass.POWER: [{CONF_TYPE: CONF_IS_POWER}],
-    SensorDeviceClass.POWER_FACTOR: [{CONF_TYPE: CONF_IS_POWER_FACTOR}],
-    SensorDeviceClass.PM1: [{CONF_TYPE: CONF_IS_PM1}],
-    SensorDeviceClass.PM10: [{CONF_TYPE: CONF_IS_PM10}],
-    SensorDeviceClass.PM25: [{CONF_TYPE: CONF_IS_PM25}],
-    SensorDeviceClass.PRESSURE: [{CONF_TYPE: CONF_IS_PRESSURE}],
-    SensorDeviceClass.REACTIVE_POWER: [{CONF_TYPE: CONF_IS_REACTIVE_POWER}],
-    SensorDeviceClass.SIGNAL_STRENGTH: [{CONF_TYPE: CONF_IS_SIGNAL_STRENGTH}],
-    SensorDeviceClass.SULPHUR_DIOXIDE: [{CONF_TYPE: CONF_IS_SULPHUR_DIOXIDE}],
-    SensorDeviceClass.TEMPERATURE: [{CONF_TYPE: CONF_IS_TEMPERATURE}],
-    SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS: [
-        {CONF_TYPE: CONF_IS_VOLATILE_ORGANIC_COMPOUNDS}
-    ],
-    SensorDeviceClass.VOLTAGE: [{CONF_TYPE: CONF_IS_VOLTAGE}],
-    DEVICE_CLASS_NONE: [{CONF_TYPE: CONF_IS_VALUE}],
+ENTITY_CONDITIONS = MappingProxyType(
+    {
+        SensorDeviceClass.APPARENT_POWER: {CONF_TYPE: CONF_IS_APPARENT_POWER},
+        SensorDeviceClass.BATTERY: {CONF_TYPE: CONF_IS_BATTERY_LEVEL},
+        SensorDeviceClass.CO: {CONF_TYPE: CONF_IS_CO},
+        SensorDeviceClass.CO2: {CONF_TYPE: CONF_IS_CO2},
+        SensorDeviceClass.CURRENT: {CONF_TYPE: CONF_IS_CURRENT},
+        SensorDeviceClass.ENERGY: {CONF_TYPE: CONF_IS_ENERGY},
+        SensorDeviceClass.FREQUENCY: {CONF_TYPE: CONF_IS_FREQUENCY},
+        SensorDeviceClass.GAS: {CONF_TYPE: CONF_IS_GAS},
+        SensorDeviceClass.HUMIDITY: {CONF_TYPE: CONF_IS_HUMIDITY},
+        SensorDeviceClass.ILLUMINANCE: {CONF_TYPE: CONF_IS_ILLUMINANCE},
+        SensorDeviceClass.NITROGEN_DIOXIDE: {CONF_TYPE: CONF_IS_NITROGEN_DIOXIDE},
+        SensorDeviceClass.NITROGEN_MONOXIDE: {CONF_TYPE: CONF_IS_NITROGEN_MONOXIDE},
+        SensorDeviceClass.NITROUS_OXIDE: {CONF_TYPE: CONF_IS_NITROUS_OXIDE},
+        SensorDeviceClass.OZONE: {CONF_TYPE: CONF_IS_OZONE},
+        SensorDeviceClass.POWER: {CONF_TYPE: CONF_IS_POWER},
+        SensorDeviceClass.POWER_FACTOR: {CONF_TYPE: CONF_IS_POWER_FACTOR},
+        SensorDeviceClass.PM1: {CONF_TYPE: CONF_IS_PM1},
+        SensorDeviceClass.PM10: {CONF_TYPE: CONF_IS_PM10},
+        SensorDeviceClass.PM25: {CONF_TYPE: CONF_IS_PM25},
+        SensorDeviceClass.PRESSURE: {CONF_TYPE: CONF_IS_PRESSURE},
+        SensorDeviceClass.REACTIVE_POWER: {CONF_TYPE: CONF_IS_REACTIVE_POWER},
+        SensorDeviceClass.SIGNAL_STRENGTH: {CONF_TYPE: CONF_IS_SIGNAL_STRENGTH},
+        SensorDeviceClass.SULPHUR_DIOXIDE: {CONF_TYPE: CONF_IS_SULPHUR_DIOXIDE},
+        SensorDeviceClass.TEMPERATURE: {CONF_TYPE: CONF_IS_TEMPERATURE},
+        SensorDeviceClass.VOLATILE_ORGANIC_COMPOUNDS: {
+            CONF_TYPE: CONF_IS_VOLATILE_ORGANIC_COMPOUNDS
+        },
+        SensorDeviceClass.VOLTAGE: {CONF_TYPE: CONF_IS_VOLTAGE},
+        DEVICE_CLASS_NONE: {CONF_TYPE: CONF_IS_VALUE},
+    }
+)
+
+# Condition templates with the static keys already merged in, so listing
+# conditions only has to add the device and entity ids per entry.
+_CONDITION_TEMPLATES = {
+    device_class: {**template, "condition": "device", "domain": DOMAIN}
+    for device_class, template in ENTITY_CONDITIONS.items()
 }
 
+CONDITION_TYPES = frozenset(
+    template[CONF_TYPE] for template in ENTITY_CONDITIONS.values()
+)
+
 CONDITION_SCHEMA = vol.All(
     cv.DEVICE_CONDITION_BASE_SCHEMA.extend(
         {
             vol.Required(CONF_ENTITY_ID): cv.entity_id,
-            vol.Required(CONF_TYPE): vol.In(
-                [
-                    CONF_IS_APPARENT_POWER,
-                    CONF_IS_BATTERY_LEVEL,
-                    CONF_IS_CO,
-                    CONF_IS_CO2,
-                    CONF_IS_CURRENT,
-                    CONF_IS_ENERGY,
-                    CONF_IS_FREQUENCY,
-                    CONF_IS_GAS,
-                    CONF_IS_HUMIDITY,
-                    CONF_IS_ILLUMINANCE,
-                    CONF_IS_OZONE,
-                    CONF_IS_NITROGEN_DIOXIDE,
-                    CONF_IS_NITROGEN_MONOXIDE,
-                    CONF_IS_NITROUS_OXIDE,
-                    CONF_IS_POWER,
-                    CONF_IS_POWER_FACTOR,
-                    CONF_IS_PM1,
-                    CONF_IS_PM10,
-                    CONF_IS_PM25,
-                    CONF_IS_PRESSURE,
-                    CONF_IS_REACTIVE_POWER,
-                    CONF_IS_SIGNAL_STRENGTH,
-                    CONF_IS_SULPHUR_DIOXIDE,
-                    CONF_IS_TEMPERATURE,
-                    CONF_IS_VOLATILE_ORGANIC_COMPOUNDS,
-                    CONF_IS_VOLTAGE,
-                    CONF_IS_VALUE,
-                ]
-            ),
-            vol.Optional(CONF_BELOW): vol.Any(vol.Coerce(float)),
-            vol.Optional(CONF_ABOVE): vol.Any(vol.Coerce(float)),
+            vol.Required(CONF_TYPE): vol.In(CONDITION_TYPES),
+            vol.Optional(CONF_BELOW): vol.Coerce(float),
+            vol.Optional(CONF_ABOVE): vol.Coerce(float),
         }
     ),
     cv.has_at_least_one_key(CONF_BELOW, CONF_ABOVE),
@@ -132,32 +125,30 @@ async def async_get_conditions(
     """List device conditions."""
     conditions: list[dict[str, str]] = []
     entity_registry = await async_get_registry(hass)
-    entries = [
-        entry
-        for entry in async_entries_for_device(entity_registry, device_id)
-        if entry.domain == DOMAIN
-    ]
+    entries = async_entries_for_device_and_domain(entity_registry, device_id, DOMAIN)
+    none_template = _CONDITION_TEMPLATES[DEVICE_CLASS_NONE]
 
     for entry in entries:
-        device_class = get_device_class(hass, entry.entity_id) or DEVICE_CLASS_NONE
-        unit_of_measurement = get_unit_of_measurement(hass, entry.entity_id)
+        # Same lookup order as get_unit_of_measurement and get_device_class, but
+        # with a single state machine lookup per entry. The unit is checked first
+        # so entries without one are skipped before resolving the device class.
+        if state := hass.states.get(entry.entity_id):
+            unit_of_measurement = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        else:
+            unit_of_measurement = entry.unit_of_measurement
 
         if not unit_of_measurement:
             continue
 
-        templates = ENTITY_CONDITIONS.get(
-            device_class, ENTITY_CONDITIONS[DEVICE_CLASS_NONE]
-        )
+        if state:
+            device_class = state.attributes.get(ATTR_DEVICE_CLASS)
+        else:
+            device_class = entry.device_class or entry.original_device_class
 
-        conditions.extend(
-            {
-                **template,
-                "condition": "device",
-                "device_id": device_id,
-                "entity_id": entry.entity_id,
-                "domain": DOMAIN,
-            }
-            for template in templates
+        template = _CONDITION_TEMPLATES.get(device_class, none_template)
+
+        conditions.append(
+            {**template, "device_id": device_id, "entity_id": entry.entity_id}
         )
 
     return conditions
@@ -168,16 +159,18 @@ def async_condition_from_config(
     hass: HomeAssistant, config: ConfigType
 ) -> condition.ConditionCheckerType:
     """Evaluate state based on configuration."""
+    # A missing threshold is passed as None, which the numeric state
+    # condition treats the same as an absent key.
     numeric_state_config = {
         condition.CONF_CONDITION: "numeric_state",
         condition.CONF_ENTITY_ID: config[CONF_ENTITY_ID],
+        condition.CONF_ABOVE: config.get(CONF_ABOVE),
+        condition.CONF_BELOW: config.get(CONF_BELOW),
     }
-    if CONF_ABOVE in config:
-        numeric_state_config[condition.CONF_ABOVE] = config[CONF_ABOVE]
-    if CONF_BELOW in config:
-        numeric_state_config[condition.CONF_BELOW] = config[CONF_BELOW]
 
-    numeric_state_config = cv.NUMERIC_STATE_CONDITION_SCHEMA(numeric_state_config)
+    # The config has already been validated against CONDITION_SCHEMA, which also
+    # coerced the thresholds to float, so NUMERIC_STATE_CONDITION_SCHEMA is not
+    # needed; numeric_state_validate_config resolves the entity id.
     numeric_state_config = condition.numeric_state_validate_config(
         hass, numeric_state_config
     )
@@ -193,18 +186,23 @@ async def async_get_condition_capabilities(hass, config):
 
     if not unit_of_measurement:
         raise InvalidDeviceAutomationConfig(
-            "No unit of measurement found for condition entity {config[CONF_ENTITY_ID]}"
+            "No unit of measurement found for condition entity "
+            f"{config[CONF_ENTITY_ID]}"
         )
 
-    return {
-        "extra_fields": vol.Schema(
-            {
-                vol.Optional(
-                    CONF_ABOVE, description={"suffix": unit_of_measurement}
-                ): vol.Coerce(float),
-                vol.Optional(
-                    CONF_BELOW, description={"suffix": unit_of_measurement}
-                ): vol.Coerce(float),
-            }
-        )
-    }
+    return {"extra_fields": _capabilities_schema(unit_of_measurement)}
+
+
+@lru_cache(maxsize=256)
+def _capabilities_schema(unit_of_measurement: str) -> vol.Schema:
+    """Return the extra fields schema for a unit of measurement."""
+    return vol.Schema(
+        {
+            vol.Optional(
+                CONF_ABOVE, description={"suffix": unit_of_measurement}
+            ): vol.Coerce(float),
+            vol.Optional(
+                CONF_BELOW, description={"suffix": unit_of_measurement}
+            ): vol.Coerce(float),
+        }
+    )
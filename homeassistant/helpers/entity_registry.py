@@ -11,6 +11,7 @@ from __future__ import annotations
 
 from collections import UserDict
 from collections.abc import Callable, Iterable, Mapping
+from itertools import count
 import logging
 from typing import TYPE_CHECKING, Any, cast
 
@@ -168,9 +169,10 @@ class EntityRegistryStore(storage.Store):
 class EntityRegistryItems(UserDict):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains two additional indexes:
+    Maintains three additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entry
+    - (device_id, domain) -> entity_id -> entry
     """
 
     def __init__(self) -> None:
@@ -178,6 +180,11 @@ class EntityRegistryItems(UserDict):
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
+        self._device_domain_index: dict[tuple[str, str], dict[str, RegistryEntry]] = {}
+        # Registration order of each entity_id, used to keep the (device_id,
+        # domain) index in the same order as this dict.
+        self._positions: dict[str, int] = {}
+        self._position_counter = count()
 
     def __setitem__(self, key: str, entry: RegistryEntry) -> None:
         """Add an item."""
@@ -185,21 +192,61 @@ class EntityRegistryItems(UserDict):
             old_entry = self[key]
             del self._entry_ids[old_entry.id]
             del self._index[(old_entry.domain, old_entry.platform, old_entry.unique_id)]
+            # Updating in place keeps the entry's position in its (device_id,
+            # domain) bucket in sync with the order of this dict.
+            old_key = (old_entry.device_id, old_entry.domain, old_entry.entity_id)
+            if old_key != (entry.device_id, entry.domain, entry.entity_id):
+                self._unindex_device_domain(old_entry)
+        else:
+            self._positions[entry.entity_id] = next(self._position_counter)
         super().__setitem__(key, entry)
         self._entry_ids.__setitem__(entry.id, entry)
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        self._index_device_domain(entry)
 
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         entry = self[key]
         self._entry_ids.__delitem__(entry.id)
         self._index.__delitem__((entry.domain, entry.platform, entry.unique_id))
+        self._unindex_device_domain(entry)
+        del self._positions[entry.entity_id]
         super().__delitem__(key)
 
     def __getitem__(self, key: str) -> RegistryEntry:
         """Get an item."""
         return cast(RegistryEntry, super().__getitem__(key))
 
+    def _index_device_domain(self, entry: RegistryEntry) -> None:
+        """Add an entry to the (device_id, domain) index."""
+        if entry.device_id is None:
+            return
+        key = (entry.device_id, entry.domain)
+        entries = self._device_domain_index.setdefault(key, {})
+        positions = self._positions
+        # A new entity always sorts last, only an existing entity moving into
+        # a non-empty bucket can end up out of registration order.
+        out_of_order = (
+            entry.entity_id not in entries
+            and len(entries) > 0
+            and positions[next(reversed(entries))] > positions[entry.entity_id]
+        )
+        entries[entry.entity_id] = entry
+        if out_of_order:
+            self._device_domain_index[key] = dict(
+                sorted(entries.items(), key=lambda item: positions[item[0]])
+            )
+
+    def _unindex_device_domain(self, entry: RegistryEntry) -> None:
+        """Remove an entry from the (device_id, domain) index."""
+        if entry.device_id is None:
+            return
+        key = (entry.device_id, entry.domain)
+        entries = self._device_domain_index[key]
+        del entries[entry.entity_id]
+        if not entries:
+            del self._device_domain_index[key]
+
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
         return self._index.get(key)
@@ -208,6 +255,18 @@ class EntityRegistryItems(UserDict):
         """Get entry from id."""
         return self._entry_ids.get(key)
 
+    def get_entries_for_device_domain(
+        self, device_id: str, domain: str
+    ) -> Iterable[RegistryEntry]:
+        """Get entries from (device_id, domain).
+
+        Returns a live view in registration order, the same order as this dict.
+        The registry must not be modified while iterating it.
+        """
+        if entries := self._device_domain_index.get((device_id, domain)):
+            return entries.values()
+        return ()
+
 
 class EntityRegistry:
     """Class to hold a registry of entities."""
@@ -694,6 +753,21 @@ def async_entries_for_device(
     ]
 
 
+@callback
+def async_entries_for_device_and_domain(
+    registry: EntityRegistry,
+    device_id: str,
+    domain: str,
+    include_disabled_entities: bool = False,
+) -> list[RegistryEntry]:
+    """Return entries that match a device and domain."""
+    return [
+        entry
+        for entry in registry.entities.get_entries_for_device_domain(device_id, domain)
+        if not entry.disabled_by or include_disabled_entities
+    ]
+
+
 @callback
 def async_entries_for_area(
     registry: EntityRegistry, area_id: str
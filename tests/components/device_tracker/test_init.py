@@ -206,8 +206,10 @@ async def test_gravatar_and_picture(hass):
     assert device.config_picture == gravatar_url
 
 
-@patch("homeassistant.components.device_tracker.legacy.DeviceTracker.see")
-@patch("homeassistant.components.demo.device_tracker.setup_scanner", autospec=True)
+@patch("homeassistant.components.device_tracker.legacy.DeviceTracker.async_see")
+@patch(
+    "homeassistant.components.demo.device_tracker.async_setup_scanner", autospec=True
+)
 async def test_discover_platform(mock_demo_setup_scanner, mock_see, hass):
     """Test discovery of device_tracker demo platform."""
     await discovery.async_load_platform(
@@ -3,7 +3,10 @@ import pytest
 
 import homeassistant.components.automation as automation
 from homeassistant.components.device_automation import DeviceAutomationType
-from homeassistant.components.sensor import DOMAIN, SensorDeviceClass
+from homeassistant.components.device_automation.exceptions import (
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.components.sensor import DOMAIN, SensorDeviceClass, device_condition
 from homeassistant.components.sensor.device_condition import ENTITY_CONDITIONS
 from homeassistant.const import CONF_PLATFORM, PERCENTAGE, STATE_UNKNOWN
 from homeassistant.helpers import device_registry
@@ -65,13 +68,12 @@ async def test_get_conditions(hass, device_reg, entity_reg, enable_custom_integr
         {
             "condition": "device",
             "domain": DOMAIN,
-            "type": condition["type"],
+            "type": ENTITY_CONDITIONS[device_class]["type"],
             "device_id": device_entry.id,
             "entity_id": platform.ENTITIES[device_class].entity_id,
         }
         for device_class in SensorDeviceClass
         if device_class in UNITS_OF_MEASUREMENT
-        for condition in ENTITY_CONDITIONS[device_class]
         if device_class != "none"
     ]
     conditions = await async_get_device_automations(
@@ -106,13 +108,12 @@ async def test_get_conditions_no_state(hass, device_reg, entity_reg):
         {
             "condition": "device",
             "domain": DOMAIN,
-            "type": condition["type"],
+            "type": ENTITY_CONDITIONS[device_class]["type"],
             "device_id": device_entry.id,
             "entity_id": entity_ids[device_class],
         }
         for device_class in SensorDeviceClass
         if device_class in UNITS_OF_MEASUREMENT
-        for condition in ENTITY_CONDITIONS[device_class]
         if device_class != "none"
     ]
     conditions = await async_get_device_automations(
@@ -227,6 +228,11 @@ async def test_get_condition_capabilities_none(
         )
         assert capabilities == expected_capabilities
 
+    for condition in conditions:
+        with pytest.raises(InvalidDeviceAutomationConfig) as excinfo:
+            await device_condition.async_get_condition_capabilities(hass, condition)
+        assert condition["entity_id"] in str(excinfo.value)
+
 
 async def test_if_state_not_above_below(
     hass, calls, caplog, enable_custom_integrations
@@ -1,6 +1,7 @@
 """Tests for the Entity Registry."""
 from unittest.mock import patch
 
+import attr
 import pytest
 import voluptuous as vol
 
@@ -982,6 +983,56 @@ async def test_disabled_entities_excluded_from_entity_list(hass, registry):
     assert entries == [entry1, entry2]
 
 
+async def test_entries_for_device_and_domain(hass, registry):
+    """Test async_entries_for_device_and_domain."""
+    device_registry = mock_device_registry(hass)
+    config_entry = MockConfigEntry(domain="light")
+
+    device_entry = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+
+    entry1 = registry.async_get_or_create(
+        "light",
+        "hue",
+        "5678",
+        config_entry=config_entry,
+        device_id=device_entry.id,
+    )
+    entry2 = registry.async_get_or_create(
+        "light",
+        "hue",
+        "ABCD",
+        config_entry=config_entry,
+        device_id=device_entry.id,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+    entry3 = registry.async_get_or_create(
+        "sensor",
+        "hue",
+        "EFGH",
+        config_entry=config_entry,
+        device_id=device_entry.id,
+    )
+
+    assert er.async_entries_for_device_and_domain(
+        registry, device_entry.id, "light"
+    ) == [entry1]
+    assert er.async_entries_for_device_and_domain(
+        registry, device_entry.id, "light", include_disabled_entities=True
+    ) == [entry1, entry2]
+    assert er.async_entries_for_device_and_domain(
+        registry, device_entry.id, "sensor"
+    ) == [entry3]
+
+    registry.async_update_entity(entry3.entity_id, device_id=None)
+    assert (
+        er.async_entries_for_device_and_domain(registry, device_entry.id, "sensor")
+        == []
+    )
+
+
 async def test_entity_max_length_exceeded(hass, registry):
     """Test that an exception is raised when the max character length is exceeded."""
 
@@ -1083,6 +1134,58 @@ def test_entity_registry_items():
     assert entities.get_entry(entry2.id) is None
 
 
+def test_entity_registry_items_device_domain_index():
+    """Test the (device_id, domain) index of the EntityRegistryItems container."""
+    entities = er.EntityRegistryItems()
+    assert list(entities.get_entries_for_device_domain("device1", "light")) == []
+
+    entry1 = er.RegistryEntry("light.entity1", "1234", "hue", device_id="device1")
+    entry2 = er.RegistryEntry("sensor.entity2", "2345", "hue", device_id="device1")
+    entry3 = er.RegistryEntry("light.entity3", "3456", "hue")
+    entities["light.entity1"] = entry1
+    entities["sensor.entity2"] = entry2
+    entities["light.entity3"] = entry3
+
+    assert list(entities.get_entries_for_device_domain("device1", "light")) == [entry1]
+    assert list(entities.get_entries_for_device_domain("device1", "sensor")) == [entry2]
+
+    entry4 = er.RegistryEntry("light.entity4", "4567", "hue", device_id="device1")
+    entities["light.entity4"] = entry4
+    updated = attr.evolve(entry1, name="renamed")
+    entities["light.entity1"] = updated
+    assert list(entities.get_entries_for_device_domain("device1", "light")) == [
+        updated,
+        entry4,
+    ]
+    del entities["light.entity4"]
+
+    moved = er.RegistryEntry("light.entity1", "1234", "hue", device_id="device2")
+    entities["light.entity1"] = moved
+    assert list(entities.get_entries_for_device_domain("device1", "light")) == []
+    assert list(entities.get_entries_for_device_domain("device2", "light")) == [moved]
+
+    # Moving into a bucket that already has later registered entries keeps
+    # registration order
+    entry5 = er.RegistryEntry("light.entity5", "5678", "hue", device_id="device3")
+    entities["light.entity5"] = entry5
+    moved = er.RegistryEntry("light.entity1", "1234", "hue", device_id="device3")
+    entities["light.entity1"] = moved
+    assert list(entities.get_entries_for_device_domain("device3", "light")) == [
+        moved,
+        entry5,
+    ]
+    assert list(entities.get_entries_for_device_domain("device3", "light")) == [
+        entry for entry in entities.values() if entry.device_id == "device3"
+    ]
+    del entities["light.entity5"]
+
+    del entities["light.entity1"]
+    entities.pop("sensor.entity2")
+    assert list(entities.get_entries_for_device_domain("device2", "light")) == []
+    assert list(entities.get_entries_for_device_domain("device3", "light")) == []
+    assert list(entities.get_entries_for_device_domain("device1", "sensor")) == []
+
+
 async def test_deprecated_disabled_by_str(hass, registry, caplog):
     """Test deprecated str use of disabled_by converts to enum and logs a warning."""
     entry = registry.async_get_or_create(